@@ -1,9 +1,31 @@
 #!/bin/bash
 
 # Build script for AWS Lambda deployment package
+#
+# Dependencies are shipped as precompiled .pyc files, which are specific to
+# the Python version that compiles them: run this with the same Python
+# version as the Lambda runtime. Set KEEP_SOURCES=1 to keep the .py files
+# for debugging.
+#
+# lxml and orjson are compiled extensions, so wheels are always fetched for
+# the Lambda platform rather than the build host. Override LAMBDA_PYTHON_VERSION
+# and LAMBDA_PLATFORM to match the function's runtime and architecture.
+
+LAMBDA_PYTHON_VERSION="${LAMBDA_PYTHON_VERSION:-3.12}"
+LAMBDA_PLATFORM="${LAMBDA_PLATFORM:-manylinux2014_x86_64}"
+
+# botocore service models to keep, everything else is removed
+BOTOCORE_SERVICES="bedrock-runtime s3"
 
 echo "Building Lambda deployment package..."
 
+# The .pyc files only load on the Python version that compiled them
+BUILD_PYTHON_VERSION=$(python3 -c 'import sys; print(f"{sys.version_info.major}.{sys.version_info.minor}")')
+if [ "$BUILD_PYTHON_VERSION" != "$LAMBDA_PYTHON_VERSION" ]; then
+    echo "Error: python3 is $BUILD_PYTHON_VERSION but the Lambda runtime is $LAMBDA_PYTHON_VERSION"
+    exit 1
+fi
+
 # Clean up previous builds
 rm -rf package/
 rm -f lambda_deployment.zip
@@ -11,8 +33,30 @@ rm -f lambda_deployment.zip
 # Create package directory
 mkdir package
 
-# Install dependencies to package directory
-pip3 install -r requirements.txt -t package/
+# Install Lambda platform wheels to package directory
+pip3 install -r requirements.txt -t package/ \
+    --platform "$LAMBDA_PLATFORM" \
+    --implementation cp \
+    --python-version "$LAMBDA_PYTHON_VERSION" \
+    --only-binary=:all: || exit 1
+
+# Trim botocore service models to the services the function calls
+for service_dir in package/botocore/data/*/; do
+    service=$(basename "$service_dir")
+    if [[ " $BOTOCORE_SERVICES " != *" $service "* ]]; then
+        rm -rf "$service_dir"
+    fi
+done
+
+# Only low-level clients are used, so boto3's resource models are not needed
+rm -rf package/boto3/data/
+
+# Precompile dependencies in place and drop the sources
+if [ "$KEEP_SOURCES" != "1" ]; then
+    python3 -m compileall -q -b package/
+    find package/ -name '*.py' -delete
+    find package/ -name '__pycache__' -type d -prune -exec rm -rf {} +
+fi
 
 # Copy Lambda function to package
 cp lambda_function.py package/
@@ -26,4 +70,4 @@ cd ..
 rm -rf package/
 
 echo "Lambda deployment package created: lambda_deployment.zip"
-echo "Upload this file to AWS Lambda console"
\ No newline at end of file
+echo "Upload this file to AWS Lambda console"
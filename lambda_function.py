@@ -14,97 +14,294 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
-import json
 import boto3
-import requests
-from requests.adapters import HTTPAdapter
+import orjson
+import urllib3
 from urllib3.util.retry import Retry
-import base64
 import os
+import hashlib
+import calendar
+import re
 import logging
-import time
-from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
-from botocore.exceptions import ClientError
-from pymongo import MongoClient
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urljoin
+import lxml.html
+from lxml import etree
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+from pymongo import InsertOne, MongoClient, UpdateOne
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-def create_session_with_retries():
-    """Create a requests session with retry strategy and proper headers"""
-    session = requests.Session()
-    
-    # Define retry strategy with connection timeout retries
+# HTTP, AWS and MongoDB clients are cached at module scope so warm invocations
+# reuse the initialized client and its open connections
+BEDROCK = None
+MONGO = None
+S3 = None
+HTTP = None
+
+# Timeouts in seconds for the county page and PDF download
+PAGE_TIMEOUT = urllib3.Timeout(connect=10, read=90)
+PDF_TIMEOUT = urllib3.Timeout(connect=10, read=120)
+
+# Read size used when streaming the PDF download
+PDF_CHUNK_SIZE = 64 * 1024
+
+# Days from each weekday (Monday=0 ... Sunday=6) to the next Monday-Friday
+NEXT_BUSINESS_DAY_DELTA = (1, 1, 1, 1, 3, 2, 1)
+
+# Link text such as "September 2025", matched without strptime's per-call format parsing
+LINK_MONTH_PATTERN = re.compile(r'([A-Za-z]+)\s+(\d{4})')
+MONTH_NUMBERS = {name.lower(): number for number, name in enumerate(calendar.month_name) if name}
+
+# Compiled once at import rather than re-parsed on every call
+FORECLOSURE_H2_XPATH = etree.XPath("//h2[contains(., 'Upcoming Foreclosure Sales')]")
+FIRST_LINK_XPATH = etree.XPath("following::ul[1]/descendant::li[1]/descendant::a[1]")
+
+# Keep-alive and a sized connection pool let botocore reuse the HTTPS
+# connection to Bedrock across warm invocations
+BEDROCK_CONFIG = Config(
+    max_pool_connections=10,
+    tcp_keepalive=True,
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+    connect_timeout=5,
+    read_timeout=60
+)
+
+def get_bedrock_client():
+    """Return the cached Bedrock runtime client, creating it on first use"""
+    global BEDROCK
+    if BEDROCK is None:
+        BEDROCK = boto3.client('bedrock-runtime', config=BEDROCK_CONFIG)
+    return BEDROCK
+
+def get_s3_client():
+    """Return the cached S3 client, creating it on first use"""
+    global S3
+    if S3 is None:
+        S3 = boto3.client('s3')
+    return S3
+
+def get_mongo_client():
+    """Return the cached MongoDB client, creating it on first use"""
+    global MONGO
+    if MONGO is None:
+        mongo_url = os.environ.get('MONGO_DB_URL')
+        if not mongo_url:
+            logger.error("MONGO_DB_URL environment variable not set")
+            raise Exception('MONGO_DB_URL environment variable not set')
+        
+        logger.info("Connecting to MongoDB")
+        MONGO = MongoClient(
+            mongo_url, 
+            tls=True, 
+            tlsAllowInvalidCertificates=True,
+            serverSelectionTimeoutMS=5000,
+            connectTimeoutMS=5000,
+            socketTimeoutMS=5000,
+            minPoolSize=1
+        )
+    return MONGO
+
+def get_auction_collection():
+    """Return the auctionitems collection"""
+    return get_mongo_client().get_default_database().auctionitems
+
+# Create clients during the Lambda INIT phase so the first invocation does
+# not pay for loading the Bedrock service model and endpoints. With
+# minPoolSize=1 pymongo's background maintenance thread opens the MongoDB
+# TLS connection while the rest of INIT and the handler proceed.
+if 'AWS_LAMBDA_FUNCTION_NAME' in os.environ:
+    get_bedrock_client()
+    if os.environ.get('MONGO_DB_URL'):
+        get_mongo_client()
+
+def create_http_pool():
+    """Create a urllib3 pool manager with retry strategy and proper headers"""
+    # Define the single retry strategy for connection, read and server errors;
+    # a response that still fails after retries is raised by check_response_status
     retry_strategy = Retry(
-        total=5,  # Increased total retries
+        total=3,
         connect=3,  # Retry connection failures
         read=3,     # Retry read failures
-        backoff_factor=2,  # Increased backoff
+        backoff_factor=1,
         status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["HEAD", "GET", "OPTIONS"]
+        allowed_methods=["HEAD", "GET", "OPTIONS"],
+        respect_retry_after_header=True,
+        raise_on_status=False
     )
     
-    # Mount adapter with retry strategy
-    adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=10, pool_maxsize=10)
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
-    
     # Set headers to mimic a real browser
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-        'Sec-Fetch-Dest': 'document',
-        'Sec-Fetch-Mode': 'navigate',
-        'Sec-Fetch-Site': 'none',
-    })
+    return urllib3.PoolManager(
+        num_pools=2,
+        maxsize=4,
+        retries=retry_strategy,
+        headers={
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.5',
+            'Accept-Encoding': 'gzip, deflate, br',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+            'Sec-Fetch-Dest': 'document',
+            'Sec-Fetch-Mode': 'navigate',
+            'Sec-Fetch-Site': 'none',
+        }
+    )
+
+def get_http_pool():
+    """Return the cached urllib3 pool manager, creating it on first use"""
+    global HTTP
+    if HTTP is None:
+        HTTP = create_http_pool()
+    return HTTP
+
+def check_response_status(response, url):
+    """Raise an HTTPError for a 4xx/5xx response that is left after retries"""
+    if response.status >= 400:
+        raise urllib3.exceptions.HTTPError(f"{response.status} error fetching {url}")
+
+def get_page_cache_key(main_url):
+    """Get the S3 key holding the cached state for a county page URL"""
+    return f"page-cache/{hashlib.sha256(main_url.encode('utf-8')).hexdigest()}.json"
+
+def load_page_cache(main_url):
+    """
+    Load the cached ETag/Last-Modified validators and link text for the county page.
+    
+    Args:
+        main_url: URL of the county foreclosure page
+        
+    Returns:
+        dict: Cached page state, empty if CACHE_BUCKET is not set, nothing is cached
+            yet or the cache cannot be read
+    """
+    bucket = os.environ.get('CACHE_BUCKET')
+    if not bucket:
+        return {}
     
-    return session
+    try:
+        response = get_s3_client().get_object(Bucket=bucket, Key=get_page_cache_key(main_url))
+        page_cache = orjson.loads(response['Body'].read())
+        logger.info(f"Loaded page cache for {main_url}: {page_cache}")
+        return page_cache
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'NoSuchKey':
+            logger.info(f"No page cache found for {main_url}")
+        else:
+            logger.warning(f"Could not load page cache for {main_url}: {str(e)}")
+        return {}
+    except (BotoCoreError, orjson.JSONDecodeError) as e:
+        logger.warning(f"Could not load page cache for {main_url}: {str(e)}")
+        return {}
+
+def save_page_cache(main_url, page_cache):
+    """
+    Save the county page state so the next run can send a conditional GET.
+    
+    Args:
+        main_url: URL of the county foreclosure page
+        page_cache: Page state to store
+    """
+    bucket = os.environ.get('CACHE_BUCKET')
+    if not bucket:
+        return
+    
+    try:
+        get_s3_client().put_object(
+            Bucket=bucket,
+            Key=get_page_cache_key(main_url),
+            Body=orjson.dumps(page_cache),
+            ContentType='application/json'
+        )
+        logger.info(f"Saved page cache for {main_url}")
+    except (ClientError, BotoCoreError, orjson.JSONEncodeError) as e:
+        logger.warning(f"Could not save page cache for {main_url}: {str(e)}")
+
+def parse_skip_fetch_until_day(value):
+    """Parse SKIP_FETCH_UNTIL_DAY as a day of the month, 0 (disabled) if unset or invalid"""
+    if not value:
+        return 0
+    try:
+        day = int(value)
+    except ValueError:
+        day = 0
+    if not 1 <= day <= 31:
+        logger.warning(f"Ignoring SKIP_FETCH_UNTIL_DAY={value!r}, expected a day of the month from 1 to 31")
+        return 0
+    return day
+
+# Environment variables are fixed for the lifetime of the container
+SKIP_FETCH_UNTIL_DAY = parse_skip_fetch_until_day(os.environ.get('SKIP_FETCH_UNTIL_DAY'))
+
+def should_skip_fetch(page_cache, today):
+    """
+    Decide whether the county page fetch can be skipped entirely.
+    
+    When SKIP_FETCH_UNTIL_DAY is set, the last run had nothing new to process
+    and the cached link month is the current or a past month, runs before
+    that day of the month reuse the cached decision.
+    
+    Args:
+        page_cache: Cached page state from load_page_cache
+        today: Current date
+        
+    Returns:
+        bool: True if the page does not need to be fetched
+    """
+    if not SKIP_FETCH_UNTIL_DAY or page_cache.get('decision') != 'skip' or today.day >= SKIP_FETCH_UNTIL_DAY:
+        return False
+    
+    # An upcoming auction month may still need processing, so only skip when
+    # the cached link is not in the future
+    try:
+        link_month = parse_link_month(page_cache.get('link_text') or '')
+    except ValueError:
+        return False
+    return link_month <= datetime(today.year, today.month, 1)
 
 def get_first_monday_of_month(year, month):
     """Get the first Monday of a given month/year"""
-    first_day = datetime(year, month, 1)
-    # Find the first Monday (weekday 0 = Monday)
-    days_ahead = 0 - first_day.weekday()
-    if days_ahead <= 0:  # Target day already happened this week or is today
-        days_ahead += 7
-    return first_day + timedelta(days_ahead)
+    # Days ahead of the 1st is always 7 - weekday (weekday 0 = Monday), so a month
+    # starting on a Monday moves to the following Monday: day 8 - weekday
+    return datetime(year, month, 8 - calendar.weekday(year, month, 1))
+
+def get_federal_holidays(year):
+    """Get the federal holidays for a year that would move the auction"""
+    return frozenset({
+        datetime(year, 1, 1).date(),                  # New Year's Day (January 1)
+        datetime(year, 7, 4).date(),                  # July 4th (Independence Day)
+        get_first_monday_of_month(year, 9).date(),    # Labor Day (first Monday in September)
+    })
+
+@lru_cache(maxsize=64)
+def get_federal_holiday_ordinals(year):
+    """Get the federal holidays for a year as cached proleptic Gregorian ordinals"""
+    return frozenset(holiday.toordinal() for holiday in get_federal_holidays(year))
 
 def is_federal_holiday(date):
     """Check if a date is a federal holiday that would move the auction"""
-    year = date.year
-    month = date.month
-    day = date.day
-    
-    # New Year's Day (January 1)
-    if month == 1 and day == 1:
-        return True
-    
-    # July 4th (Independence Day)
-    if month == 7 and day == 4:
-        return True
-    
-    # Labor Day (first Monday in September)
-    if month == 9:
-        first_monday_sept = get_first_monday_of_month(year, 9)
-        if date.date() == first_monday_sept.date():
-            return True
-    
-    return False
+    return date.toordinal() in get_federal_holiday_ordinals(date.year)
 
 def get_next_business_day(date):
-    """Get the next business day (Monday-Friday)"""
-    next_day = date + timedelta(days=1)
-    # If it's Saturday (5) or Sunday (6), move to Monday
-    while next_day.weekday() > 4:  # Monday=0, Friday=4
-        next_day += timedelta(days=1)
+    """Get the next business day (Monday-Friday) that is not a federal holiday"""
+    next_day = date + timedelta(days=NEXT_BUSINESS_DAY_DELTA[date.weekday()])
+    while is_federal_holiday(next_day):
+        next_day += timedelta(days=NEXT_BUSINESS_DAY_DELTA[next_day.weekday()])
     return next_day
 
+def parse_link_month(link_text):
+    """Parse the first day of the month from link text like 'September 2025'"""
+    match = LINK_MONTH_PATTERN.fullmatch(link_text)
+    month = MONTH_NUMBERS.get(match.group(1).lower()) if match else None
+    if month is None:
+        raise ValueError(f"link text '{link_text}' does not match 'Month YYYY'")
+    return datetime(int(match.group(2)), month, 1)
+
 def get_auction_date(year, month):
     """Get the auction date for a given month, accounting for federal holidays"""
     first_monday = get_first_monday_of_month(year, month)
@@ -119,98 +316,90 @@ def get_auction_date(year, month):
     
     return auction_date
 
-def fetch_and_parse_webpage(session, main_url):
+def extract_pdf_link(html):
+    """
+    Extract the first PDF link listed under the "Upcoming Foreclosure Sales" heading.
+    
+    Args:
+        html: County page HTML
+        
+    Returns:
+        tuple: (href, link_text) of the first link
+        
+    Raises:
+        Exception: If the heading or link cannot be found
+    """
+    tree = lxml.html.fromstring(html)
+    
+    # Find h2 with "Upcoming Foreclosure Sales" text
+    h2_elements = FORECLOSURE_H2_XPATH(tree)
+    if not h2_elements:
+        logger.error("Could not find h2 with 'Upcoming Foreclosure Sales' text")
+        raise Exception('Could not find h2 with "Upcoming Foreclosure Sales" text')
+    
+    # Find the first link in the first li of the first ul after this h2
+    links = FIRST_LINK_XPATH(h2_elements[0])
+    if not links or not links[0].get('href'):
+        logger.error("Could not find first link in foreclosure sales list")
+        raise Exception('Could not find first link in foreclosure sales list')
+    
+    return links[0].get('href'), links[0].text_content().strip()
+
+def fetch_and_parse_webpage(http, main_url, page_cache=None):
     """
     Fetch the county website and extract the PDF link for the most recent auction.
     
     Args:
-        session: Configured requests session with retry logic
+        http: Configured urllib3 pool manager with retry logic
         main_url: URL of the county foreclosure page
+        page_cache: Cached page state from load_page_cache, sent as a conditional
+            GET and updated in place with the fetched page's validators and link text
         
     Returns:
         tuple: (pdf_url, auction_month_date, calculated_auction_date)
         
     Raises:
-        Exception: If webpage cannot be fetched or parsed
+        urllib3.exceptions.HTTPError: If webpage cannot be fetched after retries
+        Exception: If webpage cannot be parsed
     """
     logger.info(f"Step 1: Fetching main page: {main_url}")
     
-    # Try multiple timeout strategies since websites don't like bots
-    timeout_strategies = [
-        (60, 90),   # (connect_timeout, read_timeout) - First try with longer timeouts
-        (45, 60),   # Second try with medium timeouts
-        (30, 45),   # Third try with shorter timeouts
-    ]
-    
-    response = None
-    last_error = None
-
-    # fetch the html contents
-    for attempt, (connect_timeout, read_timeout) in enumerate(timeout_strategies, 1):
-        try:
-            logger.info(f"Attempt {attempt}: Fetching with timeouts (connect={connect_timeout}s, read={read_timeout}s)")
-            response = session.get(main_url, timeout=(connect_timeout, read_timeout))
-            response.raise_for_status()
-            logger.info(f"Successfully fetched main page on attempt {attempt}, status code: {response.status_code}, content length: {len(response.content)} bytes")
-            break
-        except requests.exceptions.Timeout as e:
-            last_error = e
-            logger.warning(f"Attempt {attempt} timeout: {str(e)}")
-            if attempt < len(timeout_strategies):
-                time.sleep(5)  # Wait before retry
-            continue
-        except requests.exceptions.ConnectionError as e:
-            last_error = e
-            logger.warning(f"Attempt {attempt} connection error: {str(e)}")
-            if attempt < len(timeout_strategies):
-                time.sleep(10)  # Longer wait for connection errors
-            continue
-    
-    if response is None:
-        logger.error(f"All attempts failed to fetch {main_url}. Last error: {str(last_error)}")
-        raise Exception(f'Failed to fetch {main_url} after {len(timeout_strategies)} attempts. Last error: {str(last_error)}')
+    # Send a conditional GET when the page was seen before
+    if page_cache is None:
+        page_cache = {}
+    conditional_headers = {}
+    if page_cache.get('etag'):
+        conditional_headers['If-None-Match'] = page_cache['etag']
+    if page_cache.get('last_modified'):
+        conditional_headers['If-Modified-Since'] = page_cache['last_modified']
+    
+    # Retries for timeouts, connection errors and 5xx/429 are handled by the pool manager
+    response = http.request('GET', main_url, headers={**http.headers, **conditional_headers}, timeout=PAGE_TIMEOUT)
+    check_response_status(response, main_url)
+    logger.info(f"Successfully fetched main page, status code: {response.status}, content length: {len(response.data)} bytes")
+    
+    # Nothing changed since the last run, so the previous decision still stands
+    if response.status == 304:
+        link_text = page_cache.get('link_text')
+        logger.info(f"Ending job. Main page not modified since last run, most recent PDF link is: '{link_text}'")
+        return None, link_text, None
     
     # Step 2: Parse HTML and find first <a> tag after "Upcoming Foreclosure Sales" h2
     logger.info("Step 2: Parsing HTML to find PDF link")
-    soup = BeautifulSoup(response.content, 'html.parser')
-    
-    # Find h2 with "Upcoming Foreclosure Sales" text
-    h2_element = soup.find('h2', string=lambda text: text and 'Upcoming Foreclosure Sales' in text)
-    if not h2_element:
-        logger.error("Could not find h2 with 'Upcoming Foreclosure Sales' text")
-        raise Exception('Could not find h2 with "Upcoming Foreclosure Sales" text')
-    
-    # Find the first <ul> element after this h2
-    ul_element = h2_element.find_next_sibling('ul')
-    if not ul_element:
-        # Try finding ul as a descendant of next sibling
-        next_sibling = h2_element.find_next_sibling()
-        if next_sibling:
-            ul_element = next_sibling.find('ul')
-    
-    if not ul_element:
-        logger.error("Could not find ul element after 'Upcoming Foreclosure Sales' h2")
-        raise Exception('Could not find ul element after "Upcoming Foreclosure Sales" h2')
-    
-    # Find first li element in the ul
-    li_element = ul_element.find('li')
-    if not li_element:
-        logger.error("Could not find li element in foreclosure sales ul")
-        raise Exception('Could not find li element in foreclosure sales ul')
-    
-    # Find first link in the li
-    first_link = li_element.find('a')
-    if not first_link or not first_link.get('href'):
-        logger.error("Could not find first link in foreclosure sales li")
-        raise Exception('Could not find first link in foreclosure sales li')
+    pdf_href, link_text = extract_pdf_link(response.data)
     
     # Check if this is a future month
-    link_text = first_link.get_text(strip=True)
     logger.info(f"Found auction link text: '{link_text}'")
     
+    page_cache.update({
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'link_text': link_text
+    })
+    
     try:
         # Parse the month/year from link text (e.g., "September 2025")
-        auction_month_date = datetime.strptime(link_text, '%B %Y')
+        auction_month_date = parse_link_month(link_text)
         current_date = datetime.now()
         current_month_start = datetime(current_date.year, current_date.month, 1)
         
@@ -234,65 +423,51 @@ def fetch_and_parse_webpage(session, main_url):
         logger.info(f"Using fallback auction date: {calculated_auction_date.strftime('%Y-%m-%d')}")
 
     # Step 3: Construct PDF URL
-    pdf_href = first_link['href']
-    if pdf_href.startswith('/'):
-        pdf_url = 'https://www.gt' + 'county.org' + pdf_href
-    else:
-        pdf_url = pdf_href
+    # Resolve relative, protocol-relative and absolute hrefs against the page URL
+    pdf_url = urljoin(main_url, pdf_href)
     logger.info(f"Step 3: Constructed PDF URL: {pdf_url}")
     
     return pdf_url, auction_month_date, calculated_auction_date
 
 
-def download_and_validate_pdf(session, pdf_url):
+def is_pdf(headers, content, file_extension):
+    """Check if a downloaded file is a PDF by URL extension, magic number or Content-Type"""
+    return (
+        file_extension == 'pdf' or
+        content[:4] == b'%PDF' or  # PDF magic number
+        headers.get('content-type', '')[:15].lower() == 'application/pdf'
+    )
+
+
+def download_and_validate_pdf(http, pdf_url):
     """
     Download PDF file from URL and validate it's actually a PDF.
     
     Args:
-        session: Configured requests session with retry logic
+        http: Configured urllib3 pool manager with retry logic
         pdf_url: URL of the PDF file to download
         
     Returns:
-        bytes: PDF file content
+        bytearray: PDF file content
         
     Raises:
-        Exception: If download fails or file is not a PDF
+        urllib3.exceptions.HTTPError: If download fails after retries
+        Exception: If file is not a PDF
     """
     logger.info(f"Step 4: Downloading file from: {pdf_url}")
     
-    # PDF download timeout strategies (longer for file downloads)
-    pdf_timeout_strategies = [
-        (90, 120),  # (connect_timeout, read_timeout) - First try with longer timeouts
-        (60, 90),   # Second try with medium timeouts
-        (45, 60),   # Third try with shorter timeouts
-    ]
-    
-    pdf_response = None
-    last_pdf_error = None
-    
-    for attempt, (connect_timeout, read_timeout) in enumerate(pdf_timeout_strategies, 1):
-        try:
-            logger.info(f"PDF Download attempt {attempt}: Using timeouts (connect={connect_timeout}s, read={read_timeout}s)")
-            pdf_response = session.get(pdf_url, timeout=(connect_timeout, read_timeout))
-            pdf_response.raise_for_status()
-            logger.info(f"Successfully downloaded file on attempt {attempt}, status code: {pdf_response.status_code}, size: {len(pdf_response.content)} bytes")
-            break
-        except requests.exceptions.Timeout as e:
-            last_pdf_error = e
-            logger.warning(f"PDF download attempt {attempt} timeout: {str(e)}")
-            if attempt < len(pdf_timeout_strategies):
-                time.sleep(10)  # Wait before retry
-            continue
-        except requests.exceptions.ConnectionError as e:
-            last_pdf_error = e
-            logger.warning(f"PDF download attempt {attempt} connection error: {str(e)}")
-            if attempt < len(pdf_timeout_strategies):
-                time.sleep(15)  # Longer wait for connection errors
-            continue
-    
-    if pdf_response is None:
-        logger.error(f"All PDF download attempts failed for {pdf_url}. Last error: {str(last_pdf_error)}")
-        raise Exception(f'Failed to download PDF from {pdf_url} after {len(pdf_timeout_strategies)} attempts. Last error: {str(last_pdf_error)}')
+    # Stream the body into a single buffer rather than preloading response.data;
+    # retries are handled by the pool manager
+    pdf_response = http.request('GET', pdf_url, preload_content=False, timeout=PDF_TIMEOUT)
+    try:
+        check_response_status(pdf_response, pdf_url)
+        pdf_buffer = bytearray()
+        for chunk in pdf_response.stream(PDF_CHUNK_SIZE):
+            pdf_buffer.extend(chunk)
+    finally:
+        # Return the connection to the pool for reuse
+        pdf_response.release_conn()
+    logger.info(f"Successfully downloaded file, status code: {pdf_response.status}, size: {len(pdf_buffer)} bytes")
     
     # Check file type by Content-Type header or URL extension
     content_type = pdf_response.headers.get('content-type', '').lower()
@@ -301,18 +476,12 @@ def download_and_validate_pdf(session, pdf_url):
     logger.info(f"File content-type: {content_type}, extension: {file_extension}")
     
     # Validate file type - only accept PDF
-    is_pdf = (
-        'application/pdf' in content_type or 
-        file_extension == 'pdf' or
-        pdf_response.content.startswith(b'%PDF')  # PDF magic number
-    )
-    
-    if not is_pdf:
+    if not is_pdf(pdf_response.headers, pdf_buffer, file_extension):
         logger.error(f"File type not supported. Expected PDF but received content-type: {content_type}, extension: {file_extension}")
         raise Exception(f"File type not supported - only PDF files are accepted. Content-type: {content_type}, extension: {file_extension}")
     
     logger.info("File validated as PDF format")
-    return pdf_response.content
+    return pdf_buffer
 
 
 def process_pdf_with_bedrock(pdf_content, auction_date):
@@ -320,7 +489,7 @@ def process_pdf_with_bedrock(pdf_content, auction_date):
     Process PDF content with AWS Bedrock to extract foreclosure data.
     
     Args:
-        pdf_content: Raw PDF file content as bytes
+        pdf_content: Raw PDF file content as bytes or bytearray
         auction_date: Calculated auction date for the records
         
     Returns:
@@ -329,14 +498,12 @@ def process_pdf_with_bedrock(pdf_content, auction_date):
     Raises:
         Exception: If Bedrock processing fails or returns invalid JSON
     """
-    # Step 5: Encode PDF to base64 for Bedrock
-    logger.info("Step 5: Encoding PDF to base64")
-    pdf_base64 = base64.b64encode(pdf_content).decode('utf-8')
-    logger.info(f"PDF encoded to base64, length: {len(pdf_base64)} characters")
+    # Step 5: Attach raw PDF bytes as a Converse document (boto3 handles the encoding)
+    logger.info(f"Step 5: Attaching PDF document, size: {len(pdf_content)} bytes")
     
     # Step 6: Prepare Bedrock request with foreclosure parsing prompt
     logger.info("Step 6: Preparing Bedrock request")
-    bedrock = boto3.client('bedrock-runtime')
+    bedrock = get_bedrock_client()
     
     prompt = f"""You are a parser that extracts structured rows from a tabular foreclosure PDF.
 Rules:
@@ -361,63 +528,78 @@ Rules:
 - For the `auctionDate` attribute always set the value to '{auction_date}'.
 - Do NOT include any explanations or markdown—JSON only."""
 
-    request_body = {
-        "anthropic_version": "bedrock-2023-05-31",
-        "max_tokens": 4000,
-        "messages": [
-            {
-                "role": "user",
-                "content": [
-                    {
-                        "type": "document",
+    messages = [
+        {
+            "role": "user",
+            "content": [
+                {
+                    "document": {
+                        "format": "pdf",
+                        "name": "auction",
                         "source": {
-                            "type": "base64",
-                            "media_type": "application/pdf",
-                            "data": pdf_base64
+                            "bytes": pdf_content
                         }
-                    },
-                    {
-                        "type": "text",
-                        "text": prompt
                     }
-                ]
-            }
-        ]
-    }
+                },
+                {
+                    "text": prompt
+                }
+            ]
+        }
+    ]
     
     # Step 7: Call Bedrock API
     model_id = os.environ.get('MODEL_ID', 'anthropic.claude-3-7-sonnet-20250514-v1:0')
     logger.info(f"Step 7: Calling Bedrock API with model: {model_id}")
-    response = bedrock.invoke_model(
+    response = bedrock.converse(
         modelId=model_id,
-        body=json.dumps(request_body),
-        contentType='application/json'
+        messages=messages,
+        inferenceConfig={"maxTokens": 4000}
     )
     logger.info(f"Bedrock API call successful, response status: {response['ResponseMetadata']['HTTPStatusCode']}")
     
     # Step 8: Parse response
     logger.info("Step 8: Parsing Bedrock response")
-    response_body = json.loads(response['body'].read())
-    parsed_data = response_body['content'][0]['text']
+    parsed_data = response['output']['message']['content'][0]['text']
     logger.info(f"Received response from Bedrock, length: {len(parsed_data)} characters")
     
     try:
-        foreclosure_records = json.loads(parsed_data)
+        foreclosure_records = orjson.loads(parsed_data)
         logger.info(f"Successfully parsed JSON, found {len(foreclosure_records)} foreclosure records")
         return foreclosure_records
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.error(f"Failed to parse Bedrock response as JSON: {str(e)}")
         logger.error(f"Raw response: {parsed_data}")
         raise Exception(f"Failed to parse Bedrock response as JSON: {str(e)}")
 
 
-def save_records_to_mongodb(foreclosure_records, auction_date):
+def fetch_existing_items():
+    """
+    Fetch the existing SC Georgetown items from MongoDB.
+    
+    Returns:
+        list: Existing items, projected to _id and caseNumber
+        
+    Raises:
+        Exception: If MongoDB operations fail
+    """
+    logger.info("Fetching existing items from MongoDB for SC Georgetown")
+    existing_items = list(
+        get_auction_collection()
+        .find({'state': 'SC', 'county': 'Georgetown'}, projection={'_id': 1, 'caseNumber': 1})
+    )
+    logger.info(f"Found {len(existing_items)} existing items in MongoDB")
+    return existing_items
+
+
+def save_records_to_mongodb(foreclosure_records, auction_date, existing_items=None):
     """
     Save or update foreclosure records in MongoDB.
     
     Args:
         foreclosure_records: List of foreclosure record dictionaries
         auction_date: Calculated auction date for the records
+        existing_items: Existing items from fetch_existing_items, fetched here if not given
         
     Returns:
         tuple: (updated_count, created_count)
@@ -429,78 +611,59 @@ def save_records_to_mongodb(foreclosure_records, auction_date):
     updated_count = 0
     created_count = 0
     
-    # Connect to MongoDB
-    mongo_url = os.environ.get('MONGO_DB_URL')
-    if not mongo_url:
-        logger.error("MONGO_DB_URL environment variable not set")
-        raise Exception('MONGO_DB_URL environment variable not set')
-    
-    client = None
     try:
-        logger.info("Connecting to MongoDB")
-        client = MongoClient(
-            mongo_url, 
-            tls=True, 
-            tlsAllowInvalidCertificates=True,
-            serverSelectionTimeoutMS=5000,
-            connectTimeoutMS=5000,
-            socketTimeoutMS=5000
-        )
-        db = client.get_default_database()
-        collection = db.auctionitems
-        logger.info("Successfully connected to MongoDB")
+        collection = get_auction_collection()
         
         # Fetch existing items for SC Georgetown
-        logger.info("Fetching existing items from MongoDB for SC Georgetown")
-        existing_items = list(collection.find({'state': 'SC', 'county': 'Georgetown'}))
-        logger.info(f"Found {len(existing_items)} existing items in MongoDB")
-        
-        # Process each record
-        logger.info(f"Processing {len(foreclosure_records)} records")
-        for i, record in enumerate(foreclosure_records):
-            case_number = record.get('caseNumber', 'Unknown')
-            logger.info(f"Processing record {i+1}/{len(foreclosure_records)}: Case #{case_number}")
-            
+        if existing_items is None:
+            existing_items = fetch_existing_items()
+        
+        # Index existing items by caseNumber for constant-time lookups
+        existing_by_case = {item['caseNumber']: item for item in existing_items if 'caseNumber' in item}
+        
+        # Build one batch of updates and inserts for all records, sharing one timestamp
+        operations = []
+        now = datetime.now(timezone.utc)
+        for record in foreclosure_records:
             # Set the calculated auction date
             record['auctionDate'] = auction_date
             
             # Find existing item by caseNumber
-            existing_item = next((item for item in existing_items if item.get('caseNumber') == record.get('caseNumber')), None)
+            existing_item = existing_by_case.get(record.get('caseNumber'))
             
             if existing_item:
                 # Update existing record
-                logger.info(f"Updating existing record for case #{case_number}")
                 update_data = {
                     'auctionDate': auction_date,
                     'active': record.get('active', True),
-                    'updateDate': datetime.now()
+                    'updateDate': now
                 }
                 
-                collection.update_one(
+                operations.append(UpdateOne(
                     {'_id': existing_item['_id']},
                     {'$set': update_data}
-                )
-                updated_count += 1
-                logger.info(f"Successfully updated case #{case_number}")
+                ))
             else:
                 # Create new record
-                logger.info(f"Creating new record for case #{case_number}")
                 record['auctionDate'] = auction_date
                 record['active'] = record.get('active', True)
                 record['isReopen'] = False
                 record['attemptedZillowApi'] = False
                 record['attemptedRentCastApi'] = False
                 record['attemptedGeoCodeApi'] = False
-                record['createDate'] = datetime.now()
+                record['createDate'] = now
                 
-                collection.insert_one(record)
-                created_count += 1
-                logger.info(f"Successfully created case #{case_number}")
+                operations.append(InsertOne(record))
+        
+        # Send all writes in a single round-trip
+        if operations:
+            result = collection.bulk_write(operations, ordered=False)
+            # Only the updates match documents, since they are filtered by _id
+            updated_count = result.matched_count
+            created_count = result.inserted_count
     
     finally:
-        if client:
-            client.close()
-        logger.info(f"MongoDB operations complete. Updated: {updated_count}, Created: {created_count}")
+        logger.info(f"MongoDB operations complete. Processed {len(foreclosure_records)} records, Updated: {updated_count}, Created: {created_count}")
     
     return updated_count, created_count
 
@@ -521,65 +684,82 @@ def lambda_handler(event, context):
     try:
         logger.info("Starting foreclosure processing")
         
-        # Create session with retry logic and proper headers
-        session = create_session_with_retries()
+        # Reuse the pool manager (and its keep-alive connections) across warm invocations
+        http = get_http_pool()
         main_url = os.environ.get('COUNTY_URL')
         
         # Step 1-3: Fetch and parse webpage to get PDF URL
-        pdf_url, auction_month_info, auction_date = fetch_and_parse_webpage(session, main_url)
+        page_cache = load_page_cache(main_url)
+        if should_skip_fetch(page_cache, datetime.now(timezone.utc).date()):
+            logger.info(f"Skipping page fetch, most recent PDF link '{page_cache.get('link_text')}' is not an upcoming month")
+            pdf_url, auction_month_info, auction_date = None, page_cache.get('link_text'), None
+        else:
+            pdf_url, auction_month_info, auction_date = fetch_and_parse_webpage(http, main_url, page_cache)
+            if pdf_url is None:
+                page_cache['decision'] = 'skip'
+                save_page_cache(main_url, page_cache)
         
-        # Check if we should skip processing (current/past month)
+        # Check if we should skip processing (current/past month or unchanged page)
         if pdf_url is None:
             return {
                 'statusCode': 200,
-                'body': json.dumps({
+                'body': orjson.dumps({
                     'message': f'Skipped processing {auction_month_info} - showing only upcoming auctions',
                     'auction_month': auction_month_info,
                     'records_processed': 0
-                })
+                }).decode()
             }
         
-        # Step 4: Download and validate PDF file
-        pdf_content = download_and_validate_pdf(session, pdf_url)
+        # Step 4: Download and validate PDF file, fetching existing MongoDB items
+        # in the background while the download is in flight. A MongoDB failure
+        # is raised here, before paying for the Bedrock call.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            existing_items_future = executor.submit(fetch_existing_items)
+            pdf_content = download_and_validate_pdf(http, pdf_url)
+            existing_items = existing_items_future.result()
         
         # Step 5-8: Process PDF with Bedrock AI
         foreclosure_records = process_pdf_with_bedrock(pdf_content, auction_date)
         
         # Step 9: Save records to MongoDB
-        updated_count, created_count = save_records_to_mongodb(foreclosure_records, auction_date)
+        updated_count, created_count = save_records_to_mongodb(foreclosure_records, auction_date, existing_items)
+        
+        # Only remember the page once its records are saved, so a failed run is retried
+        page_cache['decision'] = 'processed'
+        save_page_cache(main_url, page_cache)
         
         return {
             'statusCode': 200,
-            'body': json.dumps({
+            'body': orjson.dumps({
                 'pdf_url': pdf_url,
                 'auction_date': auction_date.isoformat(),
                 'records_updated': updated_count,
                 'records_created': created_count,
                 'total_processed': len(foreclosure_records)
-            })
+            }).decode()
         }
         
-    except requests.RequestException as e:
+    except urllib3.exceptions.HTTPError as e:
         logger.error(f"HTTP request error: {str(e)}")
         return {
             'statusCode': 500,
-            'body': json.dumps({
+            'body': orjson.dumps({
                 'error': f'HTTP request error: {str(e)}'
-            })
+            }).decode()
         }
     except ClientError as e:
         logger.error(f"AWS Bedrock error: {str(e)}")
         return {
             'statusCode': 500,
-            'body': json.dumps({
+            'body': orjson.dumps({
                 'error': f'AWS Bedrock error: {str(e)}'
-            })
+            }).decode()
         }
     except Exception as e:
         logger.error(f"Unexpected error: {str(e)}")
         return {
             'statusCode': 500,
-            'body': json.dumps({
+            'body': orjson.dumps({
                 'error': f'Unexpected error: {str(e)}'
-            })
+            }).decode()
         }
\ No newline at end of file
@@ -15,17 +15,192 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import Mock, patch
+from types import SimpleNamespace
 from datetime import datetime, timedelta
 import json
-from bs4 import BeautifulSoup
+from botocore.exceptions import EndpointConnectionError, NoCredentialsError
+from pymongo import InsertOne, UpdateOne
+from pymongo.errors import ServerSelectionTimeoutError
 
 # Import functions from lambda_function
 from lambda_function import (
     get_first_monday_of_month,
     is_federal_holiday,
+    get_federal_holidays,
+    get_federal_holiday_ordinals,
     get_next_business_day,
-    get_auction_date
+    get_auction_date,
+    parse_link_month,
+    should_skip_fetch,
+    parse_skip_fetch_until_day,
+    load_page_cache,
+    save_page_cache,
+    fetch_and_parse_webpage,
+    extract_pdf_link,
+    save_records_to_mongodb,
+    lambda_handler,
+    is_pdf
+)
+
+
+# HTML fixtures are bytes, the form the county page arrives in
+MISSING_HEADING_HTML = b"""
+<html>
+    <body>
+        <div class="fr-view">
+            <ul>
+                <li><a href="/documents/foreclosure-jan-2025.pdf">January 2025</a></li>
+                <li><a href="/documents/foreclosure-feb-2025.pdf">February 2025</a></li>
+            </ul>
+        </div>
+    </body>
+</html>
+"""
+
+MISSING_UL_HTML = b"""
+<html>
+    <body>
+        <h2>Upcoming Foreclosure Sales</h2>
+        <p>No sales are currently scheduled</p>
+    </body>
+</html>
+"""
+
+MISSING_LI_HTML = b"""
+<html>
+    <body>
+        <h2>Upcoming Foreclosure Sales</h2>
+        <div>
+            <ul></ul>
+        </div>
+    </body>
+</html>
+"""
+
+MISSING_LINK_HTML = b"""
+<html>
+    <body>
+        <h2>Upcoming Foreclosure Sales</h2>
+        <div>
+            <ul>
+                <li>January 2025 (no link)</li>
+            </ul>
+        </div>
+    </body>
+</html>
+"""
+
+MISSING_HREF_HTML = b"""
+<html>
+    <body>
+        <h2>Upcoming Foreclosure Sales</h2>
+        <div>
+            <ul>
+                <li><a>January 2025</a></li>
+            </ul>
+        </div>
+    </body>
+</html>
+"""
+
+FORECLOSURE_SALES_HTML = b"""
+<html>
+    <body>
+        <h2>Upcoming Foreclosure Sales</h2>
+        <div>
+            <ul>
+                <li><a href="/documents/foreclosure-jan-2025.pdf"> January 2025 </a></li>
+                <li><a href="/documents/foreclosure-feb-2025.pdf">February 2025</a></li>
+            </ul>
+        </div>
+    </body>
+</html>
+"""
+
+# (href, link text) of the first PDF link in FORECLOSURE_SALES_HTML
+EXPECTED_PDF_LINK = ('/documents/foreclosure-jan-2025.pdf', 'January 2025')
+
+# Same page with an auction month that is always in the future
+FUTURE_SALES_HTML = FORECLOSURE_SALES_HTML.replace(b'January 2025', b'January 2099')
+
+# (description, county page HTML that extract_pdf_link rejects)
+EXTRACT_PDF_LINK_ERROR_CASES = (
+    ('no heading', MISSING_HEADING_HTML),
+    ('heading without a following ul', MISSING_UL_HTML),
+    ('ul without li', MISSING_LI_HTML),
+    ('li without a', MISSING_LINK_HTML),
+    ('a without href', MISSING_HREF_HTML),
+)
+
+# (SKIP_FETCH_UNTIL_DAY value, expected parsed day)
+SKIP_FETCH_UNTIL_DAY_CASES = (
+    (None, 0),
+    ('', 0),
+    ('25', 25),
+    ('1', 1),
+    ('31', 31),
+    ('0', 0),
+    ('32', 0),
+    ('-5', 0),
+    ('twenty', 0),
+)
+
+# (year, month, expected first Monday)
+FIRST_MONDAY_CASES = (
+    (2025, 1, datetime(2025, 1, 6)),   # First day is Wednesday
+    (2025, 9, datetime(2025, 9, 8)),   # First day is Monday, lambda_function moves to the next Monday
+    (2025, 2, datetime(2025, 2, 3)),   # First day is Saturday
+    (2025, 6, datetime(2025, 6, 2)),   # First day is Sunday
+    (2025, 4, datetime(2025, 4, 7)),   # First day is Tuesday
+)
+
+# (date, expected is_federal_holiday)
+FEDERAL_HOLIDAY_CASES = (
+    (datetime(2025, 1, 1), True),      # New Year's Day
+    (datetime(2025, 7, 4), True),      # July 4th
+    (datetime(2025, 9, 8), True),      # Labor Day 2025 (first Monday in September, due to lambda logic)
+    (datetime(2025, 3, 15), False),    # Regular day
+    (datetime(2025, 9, 15), False),    # Not Labor Day (third Monday in September)
+)
+
+# (date, expected next business day)
+NEXT_BUSINESS_DAY_CASES = (
+    (datetime(2025, 1, 3), datetime(2025, 1, 6)),     # Friday -> Monday
+    (datetime(2025, 1, 4), datetime(2025, 1, 6)),     # Saturday -> Monday
+    (datetime(2025, 1, 5), datetime(2025, 1, 6)),     # Sunday -> Monday
+    (datetime(2025, 1, 6), datetime(2025, 1, 7)),     # Monday -> Tuesday
+    (datetime(2024, 12, 31), datetime(2025, 1, 2)),   # Tuesday -> Thursday, skipping New Year's Day
+)
+
+# (headers, content, file_extension, expected is_pdf)
+FILE_TYPE_CASES = (
+    # PDF content-type
+    ({'content-type': 'application/pdf'}, b'%PDF-1.4 fake pdf content', 'pdf', True),
+    # Excel content-type is rejected
+    ({'content-type': 'application/vnd.ms-excel'}, b'Excel file content', 'xls', False),
+    # PDF magic number but wrong content-type
+    ({'content-type': 'application/octet-stream'}, b'%PDF-1.7 actual pdf content', 'unknown', True),
+    # PDF extension but missing content-type
+    ({}, b'some content without PDF header', 'pdf', True),
+)
+
+COUNTY_PAGE_URL = 'https://www.gtcounty.org/350/Foreclosure-Sales'
+
+# (href, expected absolute PDF URL)
+PDF_URL_CASES = (
+    ('/documents/foreclosure-jan-2025.pdf', 'https://www.gtcounty.org/documents/foreclosure-jan-2025.pdf'),
+    ('https://www.gtcounty.org/documents/foreclosure-jan-2025.pdf', 'https://www.gtcounty.org/documents/foreclosure-jan-2025.pdf'),
+    ('//www.gtcounty.org/documents/foreclosure-jan-2025.pdf', 'https://www.gtcounty.org/documents/foreclosure-jan-2025.pdf'),
+    ('DocumentCenter/View/123', 'https://www.gtcounty.org/350/DocumentCenter/View/123'),
+)
+
+# (link_text, expected month start)
+LINK_MONTH_CASES = (
+    ("January 2025", datetime(2025, 1, 1)),
+    ("February 2025", datetime(2025, 2, 1)),
+    ("December 2024", datetime(2024, 12, 1)),
+    ("September 2025", datetime(2025, 9, 1)),
 )
 
 
@@ -34,62 +209,37 @@ class TestDateMethods(unittest.TestCase):
     
     def test_get_first_monday_of_month(self):
         """Test getting first Monday of various months"""
-        # January 2025 - first day is Wednesday, so first Monday is Jan 6
-        result = get_first_monday_of_month(2025, 1)
-        self.assertEqual(result.date(), datetime(2025, 1, 6).date())
-        
-        # September 2025 - first day is Monday, but the logic in lambda_function 
-        # moves to next Monday if the day has already happened, so first Monday is Sept 8
-        result = get_first_monday_of_month(2025, 9)
-        self.assertEqual(result.date(), datetime(2025, 9, 8).date())
-        
-        # February 2025 - first day is Saturday, so first Monday is Feb 3
-        result = get_first_monday_of_month(2025, 2)
-        self.assertEqual(result.date(), datetime(2025, 2, 3).date())
+        for year, month, expected in FIRST_MONDAY_CASES:
+            with self.subTest(year=year, month=month):
+                result = get_first_monday_of_month(year, month)
+                self.assertEqual(result.date(), expected.date())
     
     def test_is_federal_holiday(self):
         """Test federal holiday detection"""
-        # New Year's Day
-        new_years = datetime(2025, 1, 1)
-        self.assertTrue(is_federal_holiday(new_years))
-        
-        # July 4th
-        july_4th = datetime(2025, 7, 4)
-        self.assertTrue(is_federal_holiday(july_4th))
-        
-        # Labor Day 2025 (first Monday in September = Sept 8, due to lambda logic)
-        labor_day = datetime(2025, 9, 8)
-        self.assertTrue(is_federal_holiday(labor_day))
-        
-        # Regular day
-        regular_day = datetime(2025, 3, 15)
-        self.assertFalse(is_federal_holiday(regular_day))
-        
-        # Not Labor Day (third Monday in September)
-        not_labor_day = datetime(2025, 9, 15)
-        self.assertFalse(is_federal_holiday(not_labor_day))
+        for date, expected in FEDERAL_HOLIDAY_CASES:
+            with self.subTest(date=date):
+                self.assertEqual(is_federal_holiday(date), expected)
+    
+    def test_get_federal_holidays(self):
+        """Test the per-year federal holiday set"""
+        holidays = get_federal_holidays(2025)
+        self.assertEqual(holidays, frozenset({
+            datetime(2025, 1, 1).date(),
+            datetime(2025, 7, 4).date(),
+            datetime(2025, 9, 8).date()
+        }))
+        
+        # Membership checks use the cached ordinals for the year
+        ordinals = get_federal_holiday_ordinals(2025)
+        self.assertEqual(ordinals, frozenset(holiday.toordinal() for holiday in holidays))
+        self.assertIs(get_federal_holiday_ordinals(2025), ordinals)
     
     def test_get_next_business_day(self):
         """Test getting next business day"""
-        # Friday -> Monday
-        friday = datetime(2025, 1, 3)  # Jan 3, 2025 is Friday
-        result = get_next_business_day(friday)
-        self.assertEqual(result.date(), datetime(2025, 1, 6).date())  # Monday
-        
-        # Saturday -> Monday
-        saturday = datetime(2025, 1, 4)  # Jan 4, 2025 is Saturday
-        result = get_next_business_day(saturday)
-        self.assertEqual(result.date(), datetime(2025, 1, 6).date())  # Monday
-        
-        # Sunday -> Monday
-        sunday = datetime(2025, 1, 5)  # Jan 5, 2025 is Sunday
-        result = get_next_business_day(sunday)
-        self.assertEqual(result.date(), datetime(2025, 1, 6).date())  # Monday
-        
-        # Monday -> Tuesday
-        monday = datetime(2025, 1, 6)  # Jan 6, 2025 is Monday
-        result = get_next_business_day(monday)
-        self.assertEqual(result.date(), datetime(2025, 1, 7).date())  # Tuesday
+        for date, expected in NEXT_BUSINESS_DAY_CASES:
+            with self.subTest(date=date):
+                result = get_next_business_day(date)
+                self.assertEqual(result.date(), expected.date())
     
     @patch('lambda_function.logger')
     def test_get_auction_date_regular_month(self, mock_logger):
@@ -115,201 +265,134 @@ class TestDateMethods(unittest.TestCase):
         mock_logger.info.assert_has_calls(expected_calls, any_order=True)
 
 
-class TestFileTypeValidation(unittest.TestCase):
-    """Test cases for file type validation"""
+class TestPageCache(unittest.TestCase):
+    """Test cases for the cached page fetch decision"""
     
-    def test_pdf_content_type_validation(self):
-        """Test PDF validation by content-type header"""
-        # Mock response with PDF content-type
-        mock_response = MagicMock()
-        mock_response.headers = {'content-type': 'application/pdf'}
-        mock_response.content = b'%PDF-1.4 fake pdf content'
-        
-        content_type = mock_response.headers.get('content-type', '').lower()
-        file_extension = 'pdf'
-        
-        is_pdf = (
-            'application/pdf' in content_type or 
-            file_extension == 'pdf' or
-            mock_response.content.startswith(b'%PDF')
-        )
-        
-        self.assertTrue(is_pdf)
+    @patch('lambda_function.SKIP_FETCH_UNTIL_DAY', 25)
+    def test_should_skip_fetch(self):
+        """Test skipping the fetch before the configured day after a skipped run"""
+        skipped = {'link_text': 'September 2025', 'decision': 'skip'}
+        processed = {'link_text': 'October 2025', 'decision': 'processed'}
+        
+        self.assertTrue(should_skip_fetch(skipped, datetime(2025, 10, 3).date()))
+        self.assertFalse(should_skip_fetch(skipped, datetime(2025, 10, 25).date()))
+        self.assertFalse(should_skip_fetch(processed, datetime(2025, 10, 3).date()))
+        self.assertFalse(should_skip_fetch({}, datetime(2025, 10, 3).date()))
     
-    def test_xls_content_type_rejection(self):
-        """Test XLS file rejection"""
-        # Mock response with Excel content-type
-        mock_response = MagicMock()
-        mock_response.headers = {'content-type': 'application/vnd.ms-excel'}
-        mock_response.content = b'Excel file content'
-        
-        content_type = mock_response.headers.get('content-type', '').lower()
-        file_extension = 'xls'
-        
-        is_pdf = (
-            'application/pdf' in content_type or 
-            file_extension == 'pdf' or
-            mock_response.content.startswith(b'%PDF')
-        )
-        
-        self.assertFalse(is_pdf)
+    @patch('lambda_function.SKIP_FETCH_UNTIL_DAY', 25)
+    def test_should_skip_fetch_future_link_month(self):
+        """Test the fetch still runs when the cached link is for an upcoming month"""
+        current = {'link_text': 'October 2025', 'decision': 'skip'}
+        upcoming = {'link_text': 'November 2025', 'decision': 'skip'}
+        unparsed = {'link_text': 'Foreclosure Sales', 'decision': 'skip'}
+        
+        self.assertTrue(should_skip_fetch(current, datetime(2025, 10, 3).date()))
+        self.assertFalse(should_skip_fetch(upcoming, datetime(2025, 10, 3).date()))
+        self.assertFalse(should_skip_fetch(unparsed, datetime(2025, 10, 3).date()))
     
-    def test_pdf_magic_number_validation(self):
-        """Test PDF validation by magic number"""
-        # Mock response with PDF magic number but wrong content-type
-        mock_response = MagicMock()
-        mock_response.headers = {'content-type': 'application/octet-stream'}
-        mock_response.content = b'%PDF-1.7 actual pdf content'
-        
-        content_type = mock_response.headers.get('content-type', '').lower()
-        file_extension = 'unknown'
-        
-        is_pdf = (
-            'application/pdf' in content_type or 
-            file_extension == 'pdf' or
-            mock_response.content.startswith(b'%PDF')
-        )
-        
-        self.assertTrue(is_pdf)
+    @patch('lambda_function.SKIP_FETCH_UNTIL_DAY', 0)
+    def test_should_skip_fetch_disabled(self):
+        """Test the fetch always runs when SKIP_FETCH_UNTIL_DAY is not set"""
+        skipped = {'link_text': 'September 2025', 'decision': 'skip'}
+        self.assertFalse(should_skip_fetch(skipped, datetime(2025, 10, 3).date()))
     
-    def test_file_extension_validation(self):
-        """Test PDF validation by file extension"""
-        # Mock response with PDF extension but missing content-type
-        mock_response = MagicMock()
-        mock_response.headers = {}
-        mock_response.content = b'some content without PDF header'
-        
-        content_type = mock_response.headers.get('content-type', '').lower()
-        file_extension = 'pdf'
-        
-        is_pdf = (
-            'application/pdf' in content_type or 
-            file_extension == 'pdf' or
-            mock_response.content.startswith(b'%PDF')
+    @patch('lambda_function.logger')
+    def test_parse_skip_fetch_until_day(self, mock_logger):
+        """Test malformed or out-of-range SKIP_FETCH_UNTIL_DAY values disable the skip"""
+        for value, expected in SKIP_FETCH_UNTIL_DAY_CASES:
+            with self.subTest(value=value):
+                self.assertEqual(parse_skip_fetch_until_day(value), expected)
+    
+    @patch('lambda_function.logger')
+    def test_fetch_not_modified(self, mock_logger):
+        """Test a 304 sends the cached validators and returns the cached link text"""
+        page_cache = {'etag': '"abc"', 'last_modified': 'Wed, 01 Oct 2025 00:00:00 GMT', 'link_text': 'September 2025'}
+        http = Mock(headers={})
+        http.request.return_value = SimpleNamespace(status=304, data=b'', headers={})
+        
+        result = fetch_and_parse_webpage(http, COUNTY_PAGE_URL, page_cache)
+        
+        self.assertEqual(result, (None, 'September 2025', None))
+        sent_headers = http.request.call_args.kwargs['headers']
+        self.assertEqual(sent_headers['If-None-Match'], '"abc"')
+        self.assertEqual(sent_headers['If-Modified-Since'], 'Wed, 01 Oct 2025 00:00:00 GMT')
+        self.assertEqual(page_cache['link_text'], 'September 2025')
+    
+    @patch('lambda_function.logger')
+    def test_fetch_updates_page_cache(self, mock_logger):
+        """Test a 200 stores the new validators and link text in the page cache"""
+        page_cache = {}
+        http = Mock(headers={})
+        http.request.return_value = SimpleNamespace(
+            status=200,
+            data=FUTURE_SALES_HTML,
+            headers={'ETag': '"def"', 'Last-Modified': 'Mon, 01 Dec 2098 00:00:00 GMT'}
         )
         
-        self.assertTrue(is_pdf)
+        fetch_and_parse_webpage(http, COUNTY_PAGE_URL, page_cache)
+        
+        self.assertNotIn('If-None-Match', http.request.call_args.kwargs['headers'])
+        self.assertEqual(page_cache, {
+            'etag': '"def"',
+            'last_modified': 'Mon, 01 Dec 2098 00:00:00 GMT',
+            'link_text': 'January 2099'
+        })
+    
+    @patch.dict('os.environ', {'CACHE_BUCKET': 'cache-bucket'})
+    @patch('lambda_function.logger')
+    @patch('lambda_function.get_s3_client')
+    def test_page_cache_errors_are_ignored(self, mock_get_s3_client, mock_logger):
+        """Test connection errors and corrupt cache objects do not abort the run"""
+        s3 = mock_get_s3_client.return_value
+        s3.get_object.return_value = {'Body': SimpleNamespace(read=lambda: b'not json')}
+        self.assertEqual(load_page_cache(COUNTY_PAGE_URL), {})
+        
+        s3.get_object.side_effect = EndpointConnectionError(endpoint_url='https://s3.amazonaws.com')
+        self.assertEqual(load_page_cache(COUNTY_PAGE_URL), {})
+        
+        s3.put_object.side_effect = NoCredentialsError()
+        save_page_cache(COUNTY_PAGE_URL, {'link_text': 'September 2025'})
+
+
+class TestFileTypeValidation(unittest.TestCase):
+    """Test cases for file type validation"""
+    
+    def test_file_type_validation(self):
+        """Test PDF validation by content-type header, magic number and file extension"""
+        for headers, content, file_extension, expected in FILE_TYPE_CASES:
+            with self.subTest(headers=headers, file_extension=file_extension):
+                # Fake response carrying only the fields the check reads
+                mock_response = SimpleNamespace(headers=headers, content=content)
+                self.assertEqual(is_pdf(mock_response.headers, mock_response.content, file_extension), expected)
 
 
 class TestHTMLParsing(unittest.TestCase):
     """Test cases for HTML parsing functionality"""
     
-    def setUp(self):
-        """Set up test HTML samples"""
-        self.valid_html = """
-        <html>
-            <body>
-                <div class="fr-view">
-                    <ul>
-                        <li><a href="/documents/foreclosure-jan-2025.pdf">January 2025</a></li>
-                        <li><a href="/documents/foreclosure-feb-2025.pdf">February 2025</a></li>
-                    </ul>
-                </div>
-            </body>
-        </html>
-        """
-        
-        self.missing_fr_view_html = """
-        <html>
-            <body>
-                <div class="other-class">
-                    <ul>
-                        <li><a href="/documents/foreclosure-jan-2025.pdf">January 2025</a></li>
-                    </ul>
-                </div>
-            </body>
-        </html>
-        """
-        
-        self.missing_li_html = """
-        <html>
-            <body>
-                <div class="fr-view">
-                    <p>No list items here</p>
-                </div>
-            </body>
-        </html>
-        """
-        
-        self.missing_link_html = """
-        <html>
-            <body>
-                <div class="fr-view">
-                    <ul>
-                        <li>January 2025 (no link)</li>
-                    </ul>
-                </div>
-            </body>
-        </html>
-        """
-    
-    def test_parse_valid_html(self):
-        """Test parsing valid HTML structure"""
-        soup = BeautifulSoup(self.valid_html, 'html.parser')
-        
-        # Find .fr-view element
-        fr_view = soup.find(class_='fr-view')
-        self.assertIsNotNone(fr_view)
-        
-        # Find li element
-        li_element = fr_view.find('li')
-        self.assertIsNotNone(li_element)
-        
-        # Find first link
-        first_link = li_element.find('a')
-        self.assertIsNotNone(first_link)
-        self.assertEqual(first_link['href'], '/documents/foreclosure-jan-2025.pdf')
-        self.assertEqual(first_link.get_text(strip=True), 'January 2025')
-    
-    def test_parse_missing_fr_view(self):
-        """Test parsing HTML missing .fr-view element"""
-        soup = BeautifulSoup(self.missing_fr_view_html, 'html.parser')
-        
-        fr_view = soup.find(class_='fr-view')
-        self.assertIsNone(fr_view)
-    
-    def test_parse_missing_li(self):
-        """Test parsing HTML missing li element"""
-        soup = BeautifulSoup(self.missing_li_html, 'html.parser')
-        
-        fr_view = soup.find(class_='fr-view')
-        self.assertIsNotNone(fr_view)
-        
-        li_element = fr_view.find('li')
-        self.assertIsNone(li_element)
+    @patch('lambda_function.logger')
+    def test_extract_pdf_link(self, mock_logger):
+        """Test extracting the first link under the Upcoming Foreclosure Sales heading"""
+        self.assertEqual(extract_pdf_link(FORECLOSURE_SALES_HTML), EXPECTED_PDF_LINK)
     
-    def test_parse_missing_link(self):
-        """Test parsing HTML missing link in li element"""
-        soup = BeautifulSoup(self.missing_link_html, 'html.parser')
-        
-        fr_view = soup.find(class_='fr-view')
-        self.assertIsNotNone(fr_view)
-        
-        li_element = fr_view.find('li')
-        self.assertIsNotNone(li_element)
-        
-        first_link = li_element.find('a')
-        self.assertIsNone(first_link)
+    @patch('lambda_function.logger')
+    def test_extract_pdf_link_missing_elements(self, mock_logger):
+        """Test pages missing the heading or any part of the first link are rejected"""
+        for description, html in EXTRACT_PDF_LINK_ERROR_CASES:
+            with self.subTest(description):
+                with self.assertRaises(Exception):
+                    extract_pdf_link(html)
     
-    def test_construct_pdf_url(self):
-        """Test PDF URL construction"""
-        base_url = 'https://www.gtcounty.org'
-        
-        # Relative URL
-        relative_href = '/documents/foreclosure-jan-2025.pdf'
-        if relative_href.startswith('/'):
-            pdf_url = base_url + relative_href
-        else:
-            pdf_url = relative_href
-        self.assertEqual(pdf_url, 'https://www.gtcounty.org/documents/foreclosure-jan-2025.pdf')
-        
-        # Absolute URL
-        absolute_href = 'https://www.gtcounty.org/documents/foreclosure-jan-2025.pdf'
-        if absolute_href.startswith('/'):
-            pdf_url = base_url + absolute_href
-        else:
-            pdf_url = absolute_href
-        self.assertEqual(pdf_url, 'https://www.gtcounty.org/documents/foreclosure-jan-2025.pdf')
+    @patch('lambda_function.logger')
+    def test_construct_pdf_url(self, mock_logger):
+        """Test the PDF URL returned by fetch_and_parse_webpage for each href form"""
+        for href, expected in PDF_URL_CASES:
+            with self.subTest(href=href):
+                html = FUTURE_SALES_HTML.replace(b'/documents/foreclosure-jan-2025.pdf', href.encode())
+                http = Mock(headers={})
+                http.request.return_value = SimpleNamespace(status=200, data=html, headers={})
+                
+                pdf_url, _, _ = fetch_and_parse_webpage(http, COUNTY_PAGE_URL)
+                self.assertEqual(pdf_url, expected)
 
 
 class TestMonthFiltering(unittest.TestCase):
@@ -317,21 +400,12 @@ class TestMonthFiltering(unittest.TestCase):
     
     def test_parse_month_from_link_text(self):
         """Test parsing month/year from link text"""
-        # Valid month formats
-        test_cases = [
-            ("January 2025", datetime(2025, 1, 1)),
-            ("February 2025", datetime(2025, 2, 1)),
-            ("December 2024", datetime(2024, 12, 1)),
-            ("September 2025", datetime(2025, 9, 1))
-        ]
-        
-        for link_text, expected_date in test_cases:
-            try:
-                auction_month_date = datetime.strptime(link_text, '%B %Y')
-                self.assertEqual(auction_month_date.year, expected_date.year)
-                self.assertEqual(auction_month_date.month, expected_date.month)
-            except ValueError:
-                self.fail(f"Failed to parse valid date: {link_text}")
+        for link_text, expected_date in LINK_MONTH_CASES:
+            with self.subTest(link_text=link_text):
+                try:
+                    self.assertEqual(parse_link_month(link_text), expected_date)
+                except ValueError:
+                    self.fail(f"Failed to parse valid date: {link_text}")
     
     def test_invalid_month_format(self):
         """Test handling invalid month format"""
@@ -345,14 +419,13 @@ class TestMonthFiltering(unittest.TestCase):
         
         for link_text in invalid_formats:
             with self.assertRaises(ValueError):
-                datetime.strptime(link_text, '%B %Y')
+                parse_link_month(link_text)
     
     def test_future_month_filtering(self):
         """Test future month filtering logic"""
         # Mock current date as January 15, 2025
         with patch('lambda_function.datetime') as mock_datetime:
             mock_datetime.now.return_value = datetime(2025, 1, 15)
-            mock_datetime.strptime = datetime.strptime
             mock_datetime.side_effect = lambda *args, **kwargs: datetime(*args, **kwargs)
             
             current_date = mock_datetime.now()
@@ -367,12 +440,122 @@ class TestMonthFiltering(unittest.TestCase):
             ]
             
             for link_text, should_process in test_cases:
-                auction_month_date = datetime.strptime(link_text, '%B %Y')
+                auction_month_date = parse_link_month(link_text)
                 is_future = auction_month_date > current_month_start
                 self.assertEqual(is_future, should_process, 
                                f"Month filtering failed for {link_text}")
 
 
+
+class TestMongoWrites(unittest.TestCase):
+    """Test cases for saving foreclosure records to MongoDB"""
+    
+    @patch('lambda_function.logger')
+    @patch('lambda_function.get_auction_collection')
+    def test_save_records_to_mongodb(self, mock_get_auction_collection, mock_logger):
+        """Test existing items are updated by _id and every new record is inserted"""
+        collection = mock_get_auction_collection.return_value
+        collection.bulk_write.return_value = SimpleNamespace(matched_count=1, inserted_count=3)
+        auction_date = datetime(2025, 2, 3)
+        existing_items = [{'_id': 'existing-id', 'caseNumber': '2024-CP-22-00001'}]
+        records = [
+            {'caseNumber': '2024-CP-22-00001', 'active': False},
+            {'caseNumber': '2024-CP-22-00002'},
+            {'address': '1 Front St'},     # No caseNumber
+            {'address': '2 Front St'},     # No caseNumber
+        ]
+        
+        with patch('lambda_function.datetime') as mock_datetime:
+            now = datetime(2025, 1, 15)
+            mock_datetime.now.return_value = now
+            updated_count, created_count = save_records_to_mongodb(records, auction_date, existing_items)
+        
+        self.assertEqual((updated_count, created_count), (1, 3))
+        operations = collection.bulk_write.call_args.args[0]
+        self.assertEqual(operations[0], UpdateOne(
+            {'_id': 'existing-id'},
+            {'$set': {'auctionDate': auction_date, 'active': False, 'updateDate': now}}
+        ))
+        self.assertEqual(operations[1:], [InsertOne(record) for record in records[1:]])
+        for record in records[1:]:
+            self.assertEqual(record['auctionDate'], auction_date)
+            self.assertEqual(record['createDate'], now)
+            self.assertFalse(record['isReopen'])
+
+
+
+@patch.dict('os.environ', {'COUNTY_URL': COUNTY_PAGE_URL})
+@patch('lambda_function.logger')
+@patch('lambda_function.save_page_cache')
+@patch('lambda_function.load_page_cache', return_value={})
+@patch('lambda_function.get_auction_collection')
+@patch('lambda_function.get_bedrock_client')
+@patch('lambda_function.get_http_pool')
+class TestLambdaHandler(unittest.TestCase):
+    """Test cases for the handler's orchestration of the fetch, Bedrock and MongoDB steps"""
+    
+    def stub_pool(self, mock_get_http_pool, page_html):
+        """Serve the county page and then a PDF from the stubbed pool"""
+        pdf_response = SimpleNamespace(
+            status=200,
+            headers={'content-type': 'application/pdf'},
+            stream=lambda chunk_size: iter([b'%PDF-1.4 fake pdf content']),
+            release_conn=lambda: None
+        )
+        page_response = SimpleNamespace(status=200, data=page_html, headers={})
+        http = Mock(headers={})
+        http.request.side_effect = [page_response, pdf_response]
+        mock_get_http_pool.return_value = http
+    
+    def test_handler_processes_upcoming_auction(self, mock_get_http_pool, mock_get_bedrock_client,
+                                                mock_get_auction_collection, mock_load_page_cache,
+                                                mock_save_page_cache, mock_logger):
+        """Test an upcoming auction is sent to Bedrock and saved, then the page is cached"""
+        self.stub_pool(mock_get_http_pool, FUTURE_SALES_HTML)
+        mock_get_bedrock_client.return_value.converse.return_value = {
+            'ResponseMetadata': {'HTTPStatusCode': 200},
+            'output': {'message': {'content': [{'text': '[{"caseNumber": "2024-CP-22-00001"}, {"caseNumber": "2024-CP-22-00002"}]'}]}}
+        }
+        collection = mock_get_auction_collection.return_value
+        collection.find.return_value = [{'_id': 'existing-id', 'caseNumber': '2024-CP-22-00001'}]
+        collection.bulk_write.return_value = SimpleNamespace(matched_count=1, inserted_count=1)
+        
+        response = lambda_handler({}, None)
+        
+        self.assertEqual(response['statusCode'], 200)
+        body = json.loads(response['body'])
+        self.assertEqual((body['records_updated'], body['records_created'], body['total_processed']), (1, 1, 2))
+        self.assertEqual(body['pdf_url'], 'https://www.gtcounty.org/documents/foreclosure-jan-2025.pdf')
+        self.assertEqual(mock_save_page_cache.call_args.args[1]['decision'], 'processed')
+    
+    def test_handler_mongo_failure_skips_bedrock(self, mock_get_http_pool, mock_get_bedrock_client,
+                                                 mock_get_auction_collection, mock_load_page_cache,
+                                                 mock_save_page_cache, mock_logger):
+        """Test a MongoDB failure is reported before the Bedrock call is made"""
+        self.stub_pool(mock_get_http_pool, FUTURE_SALES_HTML)
+        mock_get_auction_collection.return_value.find.side_effect = ServerSelectionTimeoutError('no servers')
+        
+        response = lambda_handler({}, None)
+        
+        self.assertEqual(response['statusCode'], 500)
+        mock_get_bedrock_client.return_value.converse.assert_not_called()
+        mock_save_page_cache.assert_not_called()
+    
+    def test_handler_skips_past_auction(self, mock_get_http_pool, mock_get_bedrock_client,
+                                        mock_get_auction_collection, mock_load_page_cache,
+                                        mock_save_page_cache, mock_logger):
+        """Test a past auction month is skipped and recorded in the page cache"""
+        self.stub_pool(mock_get_http_pool, FORECLOSURE_SALES_HTML)
+        
+        response = lambda_handler({}, None)
+        
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(json.loads(response['body'])['records_processed'], 0)
+        self.assertEqual(mock_save_page_cache.call_args.args[1]['decision'], 'skip')
+        mock_get_bedrock_client.return_value.converse.assert_not_called()
+        mock_get_auction_collection.assert_not_called()
+
+
 if __name__ == '__main__':
     # Run specific test suites
     unittest.main(verbosity=2)
\ No newline at end of file